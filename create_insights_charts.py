@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+"""
+AdventureWorks Sales Insights & Charts
+
+Renders the standalone analysis charts (sales performance, geographic,
+product, customer, channel/reseller and time series) from the AdventureWorks
+Sales workbook and assembles them into the interactive HTML dashboard
+(AdventureWorks_Interactive_Dashboard.html).
+"""
+
+import base64
+import io
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from joblib import Memory
+import matplotlib
+matplotlib.use('Agg')  # batch export only; skip the interactive backend
+import matplotlib.pyplot as plt
+
+warnings.filterwarnings('ignore')
+
+plt.style.use('default')
+plt.rcParams['figure.facecolor'] = 'white'
+plt.rcParams['axes.facecolor'] = 'white'
+
+FILE_PATH = 'AdventureWorks Sales (1).xlsx'
+CACHE_DIR = '.cache'
+
+# disk memoization for the whole load+join layer; joblib keys the cache on
+# the (file_path, workbook_key) arguments and serializes the NumPy-backed
+# frames fast, so a rerun with an unchanged workbook skips straight to the
+# chart rendering
+_memory = Memory(location='.joblib_cache', verbose=0)
+
+# hot groupby reductions compile to a parallel numba kernel instead of the
+# Cython path; first call pays the JIT cost, reruns hit the cache
+_NUMBA_KW = {'engine': 'numba', 'engine_kwargs': {'parallel': True}}
+
+# only the columns the chart functions actually touch, with explicit dtypes
+# for the numeric keys/measures so read_excel skips per-column inference
+SHEET_USECOLS = {
+    'Sales Order_data': ['SalesOrderLineKey', 'Channel'],
+    'Sales Territory_data': ['SalesTerritoryKey', 'Region', 'Country', 'Group'],
+    'Sales_data': ['SalesOrderLineKey', 'ResellerKey', 'CustomerKey',
+                   'ProductKey', 'OrderDateKey', 'SalesTerritoryKey',
+                   'Order Quantity', 'Unit Price', 'Total Product Cost',
+                   'Sales Amount'],
+    'Reseller_data': ['ResellerKey', 'Business Type', 'Reseller'],
+    'Date_data': ['DateKey', 'Date', 'Fiscal Year', 'Fiscal Quarter',
+                  'Month', 'MonthKey'],
+    'Product_data': ['ProductKey', 'Product', 'Color', 'List Price', 'Category'],
+    'Customer_data': ['CustomerKey', 'Customer', 'Country-Region'],
+}
+
+# join keys and low-cardinality dimensions are dictionary-encoded at load
+# time; merges and groupbys then work on integer category codes instead of
+# re-hashing int64/object values on every call
+CATEGORY_COLS = {'CustomerKey', 'ProductKey', 'SalesTerritoryKey', 'ResellerKey',
+                 'Country', 'Region', 'Group', 'Category', 'Color', 'Channel',
+                 'Business Type', 'Country-Region', 'Fiscal Year',
+                 'Fiscal Quarter', 'Month'}
+
+SHEET_DTYPES = {
+    'Sales Order_data': {'SalesOrderLineKey': 'int64'},
+    'Sales Territory_data': {'SalesTerritoryKey': 'int64'},
+    'Sales_data': {'SalesOrderLineKey': 'int64', 'ResellerKey': 'int64',
+                   'CustomerKey': 'int64', 'ProductKey': 'int64',
+                   'OrderDateKey': 'int64', 'SalesTerritoryKey': 'int64',
+                   'Order Quantity': 'int64', 'Unit Price': 'float64',
+                   'Total Product Cost': 'float64', 'Sales Amount': 'float64'},
+    'Reseller_data': {'ResellerKey': 'int64'},
+    'Date_data': {'DateKey': 'int64', 'MonthKey': 'int64'},
+    'Product_data': {'ProductKey': 'int64', 'List Price': 'float64'},
+    'Customer_data': {'CustomerKey': 'int64'},
+}
+
+
+def load_data(file_path=FILE_PATH):
+    """Load every sheet of the workbook into a dict of DataFrames.
+
+    Sheets are cached to Parquet keyed on the workbook's mtime and size, so
+    the slow Excel parse only happens when the workbook actually changes.
+    """
+    print("Loading AdventureWorks dataset...")
+    stat = os.stat(file_path)
+    cache_key = f"{stat.st_mtime_ns}_{stat.st_size}"
+
+    # calamine (Rust) streams rows instead of building openpyxl's XML DOM —
+    # much faster parse, far lower peak memory
+    excel_file = pd.ExcelFile(file_path, engine='calamine')
+    data = {}
+    for sheet in excel_file.sheet_names:
+        cache_file = os.path.join(CACHE_DIR, f"{sheet}_{cache_key}.parquet")
+        if os.path.exists(cache_file):
+            data[sheet] = pd.read_parquet(cache_file)
+        else:
+            data[sheet] = pd.read_excel(
+                file_path, sheet_name=sheet, engine='calamine',
+                usecols=SHEET_USECOLS.get(sheet),
+                dtype=SHEET_DTYPES.get(sheet),
+                parse_dates=['Date'] if sheet == 'Date_data' else None)
+            # dollar amounts and quantities don't need 64-bit width; halving
+            # the element size halves the bytes every merge/groupby scans
+            for col in data[sheet].select_dtypes('float64').columns:
+                data[sheet][col] = data[sheet][col].astype(np.float32)
+            for col in data[sheet].select_dtypes('int64').columns:
+                data[sheet][col] = data[sheet][col].astype(np.int32)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            data[sheet].to_parquet(cache_file)
+        # dictionary-encode on both branches: the integer-keyed categoricals
+        # do not survive the Parquet round-trip, so a cached read would
+        # otherwise hand back plain int32 keys and break the join alignment
+        for col in data[sheet].columns.intersection(CATEGORY_COLS):
+            data[sheet][col] = data[sheet][col].astype('category')
+        print(f"   {sheet}: {len(data[sheet]):,} rows")
+    return data
+
+
+@_memory.cache
+def prepare_frames(file_path, workbook_key):
+    """Load the workbook and materialize every frame the charts consume.
+
+    ``workbook_key`` only participates in the joblib cache key; it ties the
+    cached result to the workbook's mtime and size so edits invalidate it.
+    """
+    data = load_data(file_path)
+    sales_data = data['Sales_data']
+
+    # align category codes across both sides of each join; with shared
+    # categories pandas merges on the integer codes directly
+    for frame, key in ((data['Sales Territory_data'], 'SalesTerritoryKey'),
+                       (data['Product_data'], 'ProductKey'),
+                       (data['Customer_data'], 'CustomerKey'),
+                       (data['Reseller_data'], 'ResellerKey')):
+        sales_data[key] = sales_data[key].cat.set_categories(frame[key].cat.categories)
+
+    # the Profit columns are read by the sales chart worker and the dashboard
+    # summary; derive them once before fanning out, since worker-side column
+    # writes would not propagate back across process boundaries. The out=
+    # chain reuses one buffer instead of allocating a fresh ~1M-row array
+    # for each intermediate of (amount - cost) / amount * 100
+    amount = sales_data['Sales Amount'].to_numpy()
+    profit = np.subtract(amount, sales_data['Total Product Cost'].to_numpy())
+    sales_data['Profit'] = profit
+    margin = np.divide(profit, amount)
+    np.multiply(margin, 100.0, out=margin)
+    sales_data['Profit_Margin'] = margin
+
+    # materialize each merge once and hand the chart functions the pre-joined
+    # frames; previously every function re-ran its own multi-million row join
+    joined = {
+        # shared by the sales-performance and time-series sections; the
+        # identical ~1M-row hash join used to run once per consumer
+        'sales_dates': sales_data.merge(
+            data['Date_data'], left_on='OrderDateKey', right_on='DateKey',
+            how='left', copy=False),
+        'sales_territory': sales_data.merge(
+            data['Sales Territory_data'], on='SalesTerritoryKey', how='left'),
+        'sales_products': sales_data.merge(
+            data['Product_data'], on='ProductKey', how='left'),
+        'sales_customers': sales_data.merge(
+            data['Customer_data'], on='CustomerKey', how='left'),
+        'sales_resellers': sales_data.merge(
+            data['Sales Order_data'], on='SalesOrderLineKey', how='left')
+        .merge(data['Reseller_data'], on='ResellerKey', how='left'),
+    }
+    return data, joined
+
+
+def _truncate_labels(index, width):
+    """Shorten long axis labels to ``width`` chars with an ellipsis."""
+    labels = index.astype(str)
+    return labels.where(labels.str.len() <= width,
+                        labels.str[:width] + '...')
+
+
+def fig_to_base64(fig):
+    """Encode a figure as base64 PNG for embedding in the HTML dashboard."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight',
+                facecolor='white')
+    buffer.seek(0)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def create_sales_performance_charts(sales_data, sales_with_dates):
+    """Monthly/yearly sales trends, margin distribution and price vs volume."""
+    print("Creating sales performance charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Sales Performance Analysis', fontsize=20, fontweight='bold')
+
+    monthly_sales = sales_with_dates.groupby('MonthKey')['Sales Amount'].sum(**_NUMBA_KW).sort_index()
+    axes[0, 0].plot(range(len(monthly_sales)), monthly_sales.values / 1e6,
+                    marker='o', linewidth=2, color='#2E86AB')
+    axes[0, 0].set_title('Monthly Sales Trend', fontweight='bold')
+    axes[0, 0].set_xlabel('Month')
+    axes[0, 0].set_ylabel('Sales ($M)')
+    axes[0, 0].grid(True, alpha=0.3)
+
+    yearly_sales = sales_with_dates.groupby('Fiscal Year', observed=True)['Sales Amount'].sum(**_NUMBA_KW) / 1e6
+    bars = axes[0, 1].bar(yearly_sales.index, yearly_sales.values, color='#A23B72')
+    axes[0, 1].set_title('Revenue by Fiscal Year', fontweight='bold')
+    axes[0, 1].set_ylabel('Revenue ($M)')
+    axes[0, 1].bar_label(bars, labels=[f'${v:.1f}M' for v in yearly_sales.values],
+                         padding=3, fontweight='bold')
+
+    axes[1, 0].hist(sales_data['Profit_Margin'], bins=50, color='#F18F01',
+                    alpha=0.7, edgecolor='black')
+    axes[1, 0].axvline(sales_data['Profit_Margin'].mean(), color='red',
+                       linestyle='--',
+                       label=f"Mean: {sales_data['Profit_Margin'].mean():.1f}%")
+    axes[1, 0].set_title('Profit Margin Distribution', fontweight='bold')
+    axes[1, 0].set_xlabel('Profit Margin (%)')
+    axes[1, 0].legend()
+
+    # hexbin renders one aggregated image over the full dataset instead of
+    # 5000 sampled scatter glyphs — constant cost in gridsize, no discarded rows
+    hexes = axes[1, 1].hexbin(sales_data['Order Quantity'],
+                              sales_data['Sales Amount'],
+                              C=sales_data['Unit Price'],
+                              reduce_C_function=np.mean,
+                              gridsize=50, cmap='viridis')
+    axes[1, 1].set_title('Order Quantity vs Sales Amount', fontweight='bold')
+    axes[1, 1].set_xlabel('Order Quantity')
+    axes[1, 1].set_ylabel('Sales Amount ($)')
+    fig.colorbar(hexes, ax=axes[1, 1], label='Mean Unit Price ($)')
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('sales_performance_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'sales_performance': chart}
+
+
+def create_geographic_charts(sales_territory):
+    """Country, region and group breakdowns of sales."""
+    print("Creating geographic charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Geographic Market Analysis', fontsize=20, fontweight='bold')
+
+    country_sales = sales_territory.groupby('Country', observed=True)['Sales Amount'].sum(**_NUMBA_KW).sort_values(ascending=False)
+    bars = axes[0, 0].bar(country_sales.index, country_sales.values / 1e6, color='#2E86AB')
+    axes[0, 0].set_title('Sales by Country', fontweight='bold')
+    axes[0, 0].set_ylabel('Sales ($M)')
+    axes[0, 0].tick_params(axis='x', rotation=45)
+    axes[0, 0].bar_label(bars, labels=[f'${v / 1e6:.1f}M' for v in country_sales.values],
+                         padding=3, fontsize=9)
+
+    region_sales = sales_territory.groupby('Region', observed=True)['Sales Amount'].sum(**_NUMBA_KW).sort_values(ascending=False).head(10)
+    axes[0, 1].barh(region_sales.index[::-1], region_sales.values[::-1] / 1e6, color='#A23B72')
+    axes[0, 1].set_title('Top 10 Regions by Sales', fontweight='bold')
+    axes[0, 1].set_xlabel('Sales ($M)')
+
+    group_sales = sales_territory.groupby('Group', observed=True)['Sales Amount'].sum(**_NUMBA_KW)
+    axes[1, 0].pie(group_sales.values, labels=group_sales.index, autopct='%1.1f%%',
+                   startangle=90)
+    axes[1, 0].set_title('Sales by Territory Group', fontweight='bold')
+
+    # observed=True keeps the two-key rollup to the (Group, Country) pairs
+    # that actually occur instead of the full categorical Cartesian product
+    pivot_data = sales_territory.groupby(
+        ['Group', 'Country'], observed=True,
+        dropna=True)['Sales Amount'].sum().unstack(fill_value=0)
+    im = axes[1, 1].imshow(pivot_data.values / 1e6, cmap='YlOrRd', aspect='auto')
+    axes[1, 1].set_xticks(range(len(pivot_data.columns)))
+    axes[1, 1].set_xticklabels(pivot_data.columns, rotation=45, ha='right')
+    axes[1, 1].set_yticks(range(len(pivot_data.index)))
+    axes[1, 1].set_yticklabels(pivot_data.index)
+    axes[1, 1].set_title('Sales Heatmap: Group vs Country ($M)', fontweight='bold')
+    fig.colorbar(im, ax=axes[1, 1], shrink=0.8)
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('geographic_analysis_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'geographic': chart}
+
+
+def create_product_charts(sales_products):
+    """Product, category and color performance."""
+    print("Creating product charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Product Performance Analysis', fontsize=20, fontweight='bold')
+
+    top_products = sales_products.groupby('Product')['Sales Amount'].sum().nlargest(10)
+    product_labels = _truncate_labels(top_products.index, 30)
+    axes[0, 0].barh(product_labels[::-1], top_products.values[::-1] / 1e3, color='#2E86AB')
+    axes[0, 0].set_title('Top 10 Products by Revenue', fontweight='bold')
+    axes[0, 0].set_xlabel('Revenue ($K)')
+    axes[0, 0].tick_params(axis='y', labelsize=9)
+
+    category_sales = sales_products.groupby(
+        'Category', observed=True, dropna=True)['Sales Amount'].sum()
+    axes[0, 1].pie(category_sales.values, labels=category_sales.index,
+                   autopct='%1.1f%%', startangle=90)
+    axes[0, 1].set_title('Sales by Category', fontweight='bold')
+
+    color_sales = sales_products.groupby(
+        'Color', observed=True,
+        dropna=True)['Sales Amount'].sum().sort_values(ascending=False)
+    axes[1, 0].bar(color_sales.index, color_sales.values / 1e6, color='#F18F01')
+    axes[1, 0].set_title('Sales by Product Color', fontweight='bold')
+    axes[1, 0].set_ylabel('Sales ($M)')
+    axes[1, 0].tick_params(axis='x', rotation=45)
+
+    product_summary = sales_products.groupby('Product').agg({
+        'Sales Amount': 'sum',
+        'List Price': 'first',
+    }).dropna()
+    axes[1, 1].scatter(product_summary['List Price'], product_summary['Sales Amount'] / 1e3,
+                       alpha=0.6, color='#A23B72')
+    axes[1, 1].set_title('List Price vs Total Revenue per Product', fontweight='bold')
+    axes[1, 1].set_xlabel('List Price ($)')
+    axes[1, 1].set_ylabel('Revenue ($K)')
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('product_analysis_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'products': chart}
+
+
+def create_customer_charts(sales_customers):
+    """Customer value, frequency segmentation and geography."""
+    print("Creating customer charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Customer Analytics', fontsize=20, fontweight='bold')
+
+    customer_sales = sales_customers.groupby('Customer')['Sales Amount'].sum().nlargest(10)
+    customer_labels = _truncate_labels(customer_sales.index, 25)
+    axes[0, 0].barh(customer_labels[::-1], customer_sales.values[::-1] / 1e3, color='#2E86AB')
+    axes[0, 0].set_title('Top 10 Customers by Revenue', fontweight='bold')
+    axes[0, 0].set_xlabel('Revenue ($K)')
+    axes[0, 0].tick_params(axis='y', labelsize=9)
+
+    customer_frequency = sales_customers.groupby('CustomerKey', observed=True).size()
+    # one C binary-search pass instead of an interpreter loop per customer
+    segments = pd.cut(customer_frequency, bins=[0, 1, 3, 10, np.inf],
+                      labels=['One-time', 'Occasional (2-3)',
+                              'Regular (4-10)', 'Frequent (10+)'])
+    segment_counts = segments.value_counts()
+    axes[0, 1].pie(segment_counts.values, labels=segment_counts.index,
+                   autopct='%1.1f%%', startangle=90)
+    axes[0, 1].set_title('Customer Purchase Frequency', fontweight='bold')
+
+    country_customers = sales_customers.groupby(
+        'Country-Region', observed=True,
+        dropna=True)['Sales Amount'].sum().sort_values(ascending=False)
+    axes[1, 0].bar(country_customers.index, country_customers.values / 1e6, color='#F18F01')
+    axes[1, 0].set_title('Customer Revenue by Country', fontweight='bold')
+    axes[1, 0].set_ylabel('Revenue ($M)')
+    axes[1, 0].tick_params(axis='x', rotation=45)
+
+    customer_value = sales_customers.groupby('CustomerKey', observed=True)['Sales Amount'].sum()
+    axes[1, 1].hist(customer_value, bins=50, color='#A23B72', alpha=0.7,
+                    edgecolor='black')
+    axes[1, 1].axvline(customer_value.mean(), color='red', linestyle='--',
+                       label=f'Mean: ${customer_value.mean():,.0f}')
+    axes[1, 1].set_title('Customer Lifetime Value Distribution', fontweight='bold')
+    axes[1, 1].set_xlabel('Total Spent ($)')
+    axes[1, 1].set_xlim(0, customer_value.quantile(0.95))
+    axes[1, 1].legend()
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('customer_analysis_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'customers': chart}
+
+
+def create_channel_reseller_charts(sales_resellers):
+    """Channel split and reseller performance."""
+    print("Creating channel & reseller charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Channel & Reseller Analysis', fontsize=20, fontweight='bold')
+
+    channel_sales = sales_resellers.groupby('Channel', observed=True)['Sales Amount'].sum()
+    axes[0, 0].pie(channel_sales.values, labels=channel_sales.index,
+                   autopct='%1.1f%%', startangle=90, colors=['#2E86AB', '#F18F01'])
+    axes[0, 0].set_title('Revenue by Sales Channel', fontweight='bold')
+
+    business_sales = sales_resellers.groupby(
+        'Business Type', observed=True,
+        dropna=True)['Sales Amount'].sum().sort_values(ascending=False)
+    axes[0, 1].bar(business_sales.index, business_sales.values / 1e6, color='#A23B72')
+    axes[0, 1].set_title('Reseller Revenue by Business Type', fontweight='bold')
+    axes[0, 1].set_ylabel('Revenue ($M)')
+
+    reseller_sales = sales_resellers.groupby('Reseller')['Sales Amount'].sum()
+    reseller_sales = reseller_sales[reseller_sales.index != '[Not Applicable]'].nlargest(10)
+    reseller_labels = _truncate_labels(reseller_sales.index, 30)
+    axes[1, 0].barh(reseller_labels[::-1], reseller_sales.values[::-1] / 1e3, color='#2E86AB')
+    axes[1, 0].set_title('Top 10 Resellers by Revenue', fontweight='bold')
+    axes[1, 0].set_xlabel('Revenue ($K)')
+    axes[1, 0].tick_params(axis='y', labelsize=9)
+
+    channel_avg = sales_resellers.groupby('Channel', observed=True)['Sales Amount'].mean()
+    bars = axes[1, 1].bar(channel_avg.index, channel_avg.values, color='#F18F01')
+    axes[1, 1].set_title('Average Transaction by Channel', fontweight='bold')
+    axes[1, 1].set_ylabel('Avg Transaction ($)')
+    axes[1, 1].bar_label(bars, labels=[f'${v:,.0f}' for v in channel_avg.values],
+                         padding=3, fontweight='bold')
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('channel_reseller_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'channel_reseller': chart}
+
+
+def create_time_series_charts(sales_with_dates):
+    """Daily trend, seasonality and cumulative revenue."""
+    print("Creating time series charts...")
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    fig.suptitle('Time Series Analysis', fontsize=20, fontweight='bold')
+
+    daily_sales = sales_with_dates.groupby('Date')['Sales Amount'].sum(**_NUMBA_KW).reset_index()
+    axes[0, 0].plot(daily_sales['Date'], daily_sales['Sales Amount'] / 1e3,
+                    linewidth=0.8, color='#2E86AB', alpha=0.7)
+    # closed-form least squares: scipy's linregress also computes t-stats
+    # and p-values we never read, and importing scipy here cost a module
+    # load per call
+    x_numeric = np.arange(len(daily_sales))
+    y = daily_sales['Sales Amount'].to_numpy(dtype=np.float64)
+    slope, intercept = np.polyfit(x_numeric, y, 1)
+    trend = slope * x_numeric + intercept
+    ss_res = np.sum((y - trend) ** 2)
+    ss_tot = np.sum((y - y.mean()) ** 2)
+    r_squared = 1.0 - ss_res / ss_tot
+    axes[0, 0].plot(daily_sales['Date'], trend / 1e3,
+                    color='red', linewidth=2,
+                    label=f'Trend (R²={r_squared:.2f})')
+    axes[0, 0].set_title('Daily Sales with Trend', fontweight='bold')
+    axes[0, 0].set_ylabel('Sales ($K)')
+    axes[0, 0].legend()
+
+    # group on the integer month instead of strftime('%B'): no per-row
+    # string formatting, and the result is already in calendar order
+    monthly_pattern = sales_with_dates.groupby(
+        sales_with_dates['Date'].dt.month)['Sales Amount'].mean()
+    monthly_pattern = monthly_pattern.reindex(range(1, 13))
+    axes[0, 1].bar(range(12), monthly_pattern.values, color='#A23B72')
+    axes[0, 1].set_xticks(range(12))
+    axes[0, 1].set_xticklabels(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+                               rotation=45)
+    axes[0, 1].set_title('Average Sales by Month', fontweight='bold')
+    axes[0, 1].set_ylabel('Avg Transaction ($)')
+
+    quarterly_sales = sales_with_dates.groupby('Fiscal Quarter', observed=True)['Sales Amount'].sum(**_NUMBA_KW) / 1e6
+    axes[1, 0].bar(quarterly_sales.index, quarterly_sales.values, color='#F18F01')
+    axes[1, 0].set_title('Revenue by Fiscal Quarter', fontweight='bold')
+    axes[1, 0].set_ylabel('Revenue ($M)')
+    axes[1, 0].tick_params(axis='x', rotation=45)
+
+    cumulative = daily_sales['Sales Amount'].cumsum() / 1e6
+    axes[1, 1].plot(daily_sales['Date'], cumulative, linewidth=2, color='#2E86AB')
+    axes[1, 1].fill_between(daily_sales['Date'], cumulative, alpha=0.3, color='#2E86AB')
+    axes[1, 1].set_title('Cumulative Revenue', fontweight='bold')
+    axes[1, 1].set_ylabel('Cumulative Revenue ($M)')
+
+    plt.tight_layout()
+    chart = fig_to_base64(fig)
+    plt.savefig('time_series_charts.svg', bbox_inches='tight')
+    plt.close(fig)
+    return {'time_series': chart}
+
+
+def create_comprehensive_dashboard(data, sales_charts, geo_charts, product_charts,
+                                   customer_charts, channel_charts, time_charts):
+    """Assemble the interactive HTML dashboard from the rendered charts."""
+    print("Building interactive HTML dashboard...")
+    sales_data = data['Sales_data']
+
+    # one fused pass over the frame instead of five separate column scans;
+    # nunique on the category-typed keys counts integer codes, not hashes
+    totals = sales_data.agg({'Sales Amount': ['sum', 'mean'],
+                             'Profit': ['sum'],
+                             'CustomerKey': ['nunique'],
+                             'ProductKey': ['nunique']})
+    summary = {
+        'total_revenue': totals.at['sum', 'Sales Amount'],
+        'total_profit': totals.at['sum', 'Profit'],
+        'total_transactions': len(sales_data),
+        'unique_customers': int(totals.at['nunique', 'CustomerKey']),
+        'unique_products': int(totals.at['nunique', 'ProductKey']),
+        'countries': data['Sales Territory_data']['Country'].nunique(),
+        'avg_order_value': totals.at['mean', 'Sales Amount'],
+    }
+    profit_margin = summary['total_profit'] / summary['total_revenue'] * 100
+    timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+
+    charts = {
+        '📈 Sales Performance Trends':
+            ('Monthly sales progression and growth patterns',
+             'Sales Trend Analysis', sales_charts['sales_performance']),
+        '🌍 Geographic Market Analysis':
+            ('Regional performance and market distribution',
+             'Geographic Analysis', geo_charts['geographic']),
+        '🛍️ Product Performance Intelligence':
+            ('Top products and category performance metrics',
+             'Product Performance', product_charts['products']),
+        '👥 Customer Analytics':
+            ('Customer lifetime value and engagement patterns',
+             'Customer Analytics', customer_charts['customers']),
+        '🤝 Channel & Reseller Analysis':
+            ('Channel economics and reseller performance',
+             'Channel Analysis', channel_charts['channel_reseller']),
+        '💹 Time Series & Profitability':
+            ('Trends, seasonality and cumulative performance',
+             'Time Series Analysis', time_charts['time_series']),
+    }
+    total_charts = sum(len(c) for c in (sales_charts, geo_charts, product_charts,
+                                        customer_charts, channel_charts, time_charts))
+
+    # stream each logical section straight to the (large-buffered) file handle
+    # rather than assembling the whole document — base64 payloads included —
+    # as one monolithic in-memory string first
+    output_file = 'AdventureWorks_Interactive_Dashboard.html'
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AdventureWorks Business Intelligence Dashboard</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+               background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+               min-height: 100vh; color: #333; }}
+        .dashboard-container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
+        .header {{ text-align: center; color: white; margin-bottom: 40px; padding: 40px;
+                  background: rgba(255, 255, 255, 0.1); border-radius: 20px; }}
+        .header h1 {{ font-size: 4rem; margin-bottom: 15px; }}
+        .header p {{ font-size: 1.4rem; opacity: 0.9; margin-bottom: 20px; }}
+        .header .timestamp {{ font-size: 1rem; opacity: 0.7; font-style: italic; }}
+        .kpi-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+                    gap: 25px; margin-bottom: 50px; }}
+        .kpi-card {{ background: white; padding: 30px; border-radius: 20px;
+                    text-align: center; box-shadow: 0 15px 35px rgba(0,0,0,0.1); }}
+        .kpi-icon {{ font-size: 3rem; margin-bottom: 15px; display: block; }}
+        .kpi-value {{ font-size: 3rem; font-weight: bold; color: #667eea;
+                     margin-bottom: 10px; line-height: 1; }}
+        .kpi-label {{ font-size: 1.2rem; color: #666; }}
+        .chart-section {{ background: white; border-radius: 20px; margin-bottom: 40px;
+                         overflow: hidden; box-shadow: 0 15px 35px rgba(0,0,0,0.1); }}
+        .chart-header {{ background: linear-gradient(135deg, #667eea, #764ba2);
+                        color: white; padding: 25px 35px; }}
+        .chart-header h2 {{ font-size: 2rem; margin-bottom: 5px; }}
+        .chart-content {{ padding: 35px; }}
+        .chart-image {{ width: 100%; height: auto; border-radius: 12px; }}
+        .footer {{ text-align: center; color: white; padding: 30px;
+                  background: rgba(255, 255, 255, 0.1); border-radius: 20px; }}
+    </style>
+</head>
+<body>
+    <div class="dashboard-container">
+        <div class="header">
+            <h1>🚀 AdventureWorks BI Dashboard</h1>
+            <p>Comprehensive Business Intelligence & Analytics Platform</p>
+            <div class="timestamp">Last Updated: {timestamp}</div>
+        </div>
+""")
+        f.write(f"""
+        <div class="kpi-grid">
+            <div class="kpi-card">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-value">${summary['total_revenue'] / 1e6:.1f}M</div>
+                <div class="kpi-label">Total Revenue</div>
+            </div>
+            <div class="kpi-card">
+                <div class="kpi-icon">💹</div>
+                <div class="kpi-value">${summary['total_profit'] / 1e6:.1f}M</div>
+                <div class="kpi-label">Total Profit ({profit_margin:.1f}% Margin)</div>
+            </div>
+            <div class="kpi-card">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-value">{summary['unique_customers']:,}</div>
+                <div class="kpi-label">Customers ({summary['countries']} Countries)</div>
+            </div>
+            <div class="kpi-card">
+                <div class="kpi-icon">📦</div>
+                <div class="kpi-value">{summary['total_transactions']:,}</div>
+                <div class="kpi-label">Transactions (${summary['avg_order_value']:,.0f} AOV)</div>
+            </div>
+            <div class="kpi-card">
+                <div class="kpi-icon">🛍️</div>
+                <div class="kpi-value">{summary['unique_products']:,}</div>
+                <div class="kpi-label">Products</div>
+            </div>
+        </div>
+""")
+        for title, (subtitle, alt, payload) in charts.items():
+            f.write(f"""
+        <div class="chart-section">
+            <div class="chart-header">
+                <h2>{title}</h2>
+                <p>{subtitle}</p>
+            </div>
+            <div class="chart-content">
+                <img src="data:image/png;base64,{payload}" alt="{alt}" class="chart-image">
+            </div>
+        </div>
+""")
+        f.write(f"""
+        <div class="footer">
+            <h3>📊 Dashboard Information</h3>
+            <p>{total_charts} chart sections · {summary['total_transactions']:,} transactions analyzed</p>
+            <p style="margin-top: 15px; opacity: 0.8;">Generated on {timestamp}</p>
+        </div>
+    </div>
+</body>
+</html>""")
+
+    print(f"Dashboard written to {output_file}")
+    return output_file
+
+
+def main():
+    print("=" * 60)
+    print("ADVENTUREWORKS SALES INSIGHTS & CHARTS")
+    print("=" * 60)
+
+    stat = os.stat(FILE_PATH)
+    data, joined = prepare_frames(FILE_PATH, f"{stat.st_mtime_ns}_{stat.st_size}")
+    sales_data = data['Sales_data']
+
+    # the six chart builders are independent and CPU-bound in groupby +
+    # Agg rendering; run one process each (matplotlib is process-safe)
+    with ProcessPoolExecutor(max_workers=6) as ex:
+        futures = [
+            ex.submit(create_sales_performance_charts, sales_data,
+                      joined['sales_dates']),
+            ex.submit(create_geographic_charts, joined['sales_territory']),
+            ex.submit(create_product_charts, joined['sales_products']),
+            ex.submit(create_customer_charts, joined['sales_customers']),
+            ex.submit(create_channel_reseller_charts, joined['sales_resellers']),
+            ex.submit(create_time_series_charts, joined['sales_dates']),
+        ]
+        (sales_charts, geo_charts, product_charts, customer_charts,
+         channel_charts, time_charts) = [f.result() for f in futures]
+
+    create_comprehensive_dashboard(data, sales_charts, geo_charts, product_charts,
+                                   customer_charts, channel_charts, time_charts)
+    print("All insights generated.")
+
+
+if __name__ == '__main__':
+    main()